@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 import argparse
-import base64
-import csv
+import binascii
+import functools
+import itertools
 import math
 import sys
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    # SIMD-accelerated drop-in replacement for base64.b64decode, used when installed
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
 
 
 def calculate_ansi_midband_frequency(band_index: int) -> float:
@@ -20,12 +27,33 @@ def calculate_ansi_midband_frequency(band_index: int) -> float:
     return 10 ** (band_number / 10)
 
 
+# Formatted midband frequencies for band indices 0-63, covering any autodetected input
+ANSI_FREQ_STR: Tuple[str, ...] = tuple(
+    f"{calculate_ansi_midband_frequency(i):.2f}" for i in range(64)
+)
+
+
+def ansi_midband_frequency_strings(count: int) -> Tuple[str, ...]:
+    """Return formatted midband frequencies for at least the first count band indices."""
+    if count <= len(ANSI_FREQ_STR):
+        return ANSI_FREQ_STR
+    return ANSI_FREQ_STR + tuple(
+        f"{calculate_ansi_midband_frequency(i):.2f}"
+        for i in range(len(ANSI_FREQ_STR), count)
+    )
+
+
 # The 185.642 constant is specific to the first version of Borealis and may change in future hardware revisions
 MIN_BOREALIS_SPL_DB: float = -192 + 185.642
 
 
 def calculate_pgram_frequencies(df: float, bands_per_octave: int = 24) -> List[float]:
     """Calculate frequency bins for pgram data using hybrid linear/log spacing."""
+    return list(_pgram_frequencies(df, bands_per_octave))
+
+
+@functools.lru_cache(maxsize=8)
+def _pgram_frequencies(df: float, bands_per_octave: int) -> Tuple[float, ...]:
     # Calculate transition point: N = ceil(bands_per_octave / log(2))
     N = math.ceil(bands_per_octave / math.log(2))
 
@@ -33,101 +61,155 @@ def calculate_pgram_frequencies(df: float, bands_per_octave: int = 24) -> List[f
     linear_freqs = [i * df for i in range(2, N)]
 
     # Log-spaced bins start at N*df
-    log_freqs = []
     f_start = N * df
 
     # Generate log-spaced frequencies with 24 bands per octave
     # Each octave multiplies frequency by 2, so each band multiplies by 2^(1/24)
     factor = 2 ** (1 / bands_per_octave)
-    f = f_start
 
-    # Generate log frequencies up to reasonable acoustic range (e.g., 20 kHz)
-    while f <= 20000 and len(log_freqs) < 200:  # Reasonable upper limits
-        log_freqs.append(f)
-        f *= factor
+    # Generate log frequencies up to reasonable acoustic range (e.g., 20 kHz), at most 200 bins
+    if math.isnan(f_start) or f_start > 20000:
+        count = 0  # NaN and anything above 20 kHz (including inf) yield no log bins
+    elif f_start <= 0:
+        count = 200  # a non-positive start frequency never reaches 20 kHz
+    else:
+        ratio = 20000 / f_start  # overflows to inf for denormal start frequencies
+        if math.isinf(ratio):
+            count = 200
+        else:
+            count = min(math.floor(math.log(ratio) / math.log(factor)) + 1, 200)
+            # The log estimate can be off by one where a bin lands on 20 kHz, so settle
+            # it against the bins actually emitted
+            while count < 200 and f_start * factor**count <= 20000:
+                count += 1
+            while count > 0 and f_start * factor ** (count - 1) > 20000:
+                count -= 1
+    log_freqs = [f_start * factor**n for n in range(count)]
+
+    return tuple(linear_freqs + log_freqs)
 
-    return linear_freqs + log_freqs
 
+def calc_db_step_for_bits(bits_per_datum: int) -> float:
+    data_range: int = 2**bits_per_datum
+    return 192 / data_range
 
-def unpack_nibble(bytes: bytes, inibble_abs: int) -> int:
-    ibyte: int = inibble_abs // 2
-    inibble: int = inibble_abs % 2
-    return (int)(bytes[ibyte] >> (4 * inibble)) & 0xF
 
+# dB step of 8-bit (statistics, pgram) and 12-bit (spectrum) codes
+CSTEP_8: float = calc_db_step_for_bits(8)  # 0.75 dB
+CSTEP_12: float = calc_db_step_for_bits(12)  # 0.046875 dB
 
-def unpack_three_nibbles(bytes: bytes, inibble_abs: int) -> int:
-    return (
-        unpack_nibble(bytes, inibble_abs + 0) << 0
-        | unpack_nibble(bytes, inibble_abs + 1) << 4
-        | unpack_nibble(bytes, inibble_abs + 2) << 8
-    )
+# SPL in dB for every possible 8-bit and 12-bit code
+SPL_LUT_8: Tuple[float, ...] = tuple(
+    code * CSTEP_8 + MIN_BOREALIS_SPL_DB for code in range(2**8)
+)
+SPL_LUT_12: Tuple[float, ...] = tuple(
+    code * CSTEP_12 + MIN_BOREALIS_SPL_DB for code in range(2**12)
+)
 
+# SPL_LUT_12 regrouped by one nibble of the middle byte of a 3-byte group: row n holds
+# v0 = b0 | n << 8 indexed by b0, column n holds v1 = n | b2 << 4 indexed by b2
+_SPL_LUT_12_ROWS: Tuple[Tuple[float, ...], ...] = tuple(
+    SPL_LUT_12[n << 8 : (n + 1) << 8] for n in range(16)
+)
+_SPL_LUT_12_COLUMNS: Tuple[Tuple[float, ...], ...] = tuple(
+    SPL_LUT_12[n::16] for n in range(16)
+)
 
-def calc_db_step_for_bits(bits_per_datum: int) -> float:
-    data_range: int = 2**bits_per_datum
-    return 192 / data_range
+# bytes.translate tables extracting the low and high nibble of every byte
+_LOW_NIBBLES: bytes = bytes(b & 0x0F for b in range(256))
+_HIGH_NIBBLES: bytes = bytes(b >> 4 for b in range(256))
 
+# Parsed SPLs are always lookup table entries, so their CSV formatting can be cached too
+SPL_STR: Dict[float, str] = {spl: f"{spl:.2f}" for spl in SPL_LUT_8 + SPL_LUT_12}
 
-def parse_borealis_spectrum(base64_string: str) -> Optional[List[float]]:
+
+def parse_borealis_spectrum(base64_string: Union[str, bytes]) -> Optional[List[float]]:
     try:
-        raw_bytes = base64.b64decode(base64_string)
-    except:
+        raw_bytes = b64decode(base64_string, validate=False)
+    except (binascii.Error, ValueError):
         return None
 
-    cstep: float = calc_db_step_for_bits(12)
+    return parse_borealis_spectrum_from_bytes(raw_bytes)
+
 
+def parse_borealis_spectrum_from_bytes(raw_bytes: bytes) -> List[float]:
+    """Unpack already decoded spectrum bytes, e.g. when batch processing many spectra."""
     # number of decidecade bands
     D: int = (len(raw_bytes) * 2) // 3
 
-    # extract number between 0 and 4095 inclusive from packed bytes, scale and shift
-    spls_dB = [
-        unpack_three_nibbles(raw_bytes, 3 * id) * cstep + MIN_BOREALIS_SPL_DB
-        for id in range(D)
+    # every 3 bytes hold two 12-bit values: v0 = b0 | (b1 & 0xF) << 8 and v1 = b1 >> 4 | b2 << 4;
+    # split the nibbles of all middle bytes in one pass, then look up both values by nibble
+    middle_bytes = bytes(raw_bytes[1::3])
+    spls_dB: List[float] = [0.0] * D
+    spls_dB[0::2] = [
+        _SPL_LUT_12_ROWS[low][b0]
+        for b0, low in zip(raw_bytes[0::3], middle_bytes.translate(_LOW_NIBBLES))
+    ]
+    spls_dB[1::2] = [
+        _SPL_LUT_12_COLUMNS[high][b2]
+        for high, b2 in zip(middle_bytes.translate(_HIGH_NIBBLES), raw_bytes[2::3])
     ]
     return spls_dB
 
 
-def parse_borealis_pgram(base64_string: str, df: float) -> Optional[List[float]]:
+def parse_borealis_pgram(
+    base64_string: Union[str, bytes], df: float
+) -> Optional[List[float]]:
     """Parse pgram (spectrogram) data with hybrid linear/log frequency spacing."""
     try:
-        raw_bytes = base64.b64decode(base64_string)
-    except:
+        raw_bytes = b64decode(base64_string, validate=False)
+    except (binascii.Error, ValueError):
         return None
 
-    cstep: float = calc_db_step_for_bits(8)  # 0.75 dB steps
+    return parse_borealis_pgram_from_bytes(raw_bytes)
 
-    # Extract single byte values, scale and shift
-    spls_dB = [
-        raw_bytes[i] * cstep + MIN_BOREALIS_SPL_DB for i in range(len(raw_bytes))
-    ]
+
+def parse_borealis_pgram_from_bytes(raw_bytes: bytes) -> List[float]:
+    """Convert already decoded pgram bytes to SPLs."""
+    # Look up the scaled and shifted SPL of each single byte value (0.75 dB steps)
+    spls_dB = [SPL_LUT_8[value] for value in raw_bytes]
     return spls_dB
 
 
-def parse_borealis_levels_stats(base64_string: str) -> Optional[List[List[float]]]:
+def parse_borealis_levels_stats(
+    base64_string: Union[str, bytes]
+) -> Optional[List[List[float]]]:
     try:
-        raw_bytes: bytes = base64.b64decode(base64_string)
-    except:
+        raw_bytes: bytes = b64decode(base64_string, validate=False)
+    except (binascii.Error, ValueError):
         return None
 
-    cstep: float = calc_db_step_for_bits(8)
+    return parse_borealis_levels_stats_from_bytes(raw_bytes)
+
 
+def parse_borealis_levels_stats_from_bytes(raw_bytes: bytes) -> List[List[float]]:
+    """Convert already decoded statistics bytes to per-band (Q1, Q2, Q3, Mean) SPLs."""
     # number of stats (3 quartiles and mean)
     K: int = 4
 
-    # number of decidecade bands
-    D: int = len(raw_bytes) // K
+    # strided slices gather each stat across all decidecade bands in C; zipping them
+    # yields one (Q1, Q2, Q3, Mean) group per complete band
+    stats_by_band = zip(*(raw_bytes[k::K] for k in range(K)))
 
-    # extract single byte values, scale and shift
-    tmp: List[float] = [
-        raw_bytes[id] * cstep + MIN_BOREALIS_SPL_DB for id in range(D * K)
+    # look up single byte values, scaled and shifted, into a length-D list of length-K lists
+    reshaped: List[List[float]] = [
+        [SPL_LUT_8[q1], SPL_LUT_8[q2], SPL_LUT_8[q3], SPL_LUT_8[mean]]
+        for q1, q2, q3, mean in stats_by_band
     ]
-
-    # reshape into length-D list of length-K lists
-    reshaped: List[List[float]] = [tmp[i : (i + K)] for i in range(0, K * D, K)]
     return reshaped
 
 
-if __name__ == "__main__":
+def detect_data_type(line: Union[str, bytes]) -> str:
+    """Infer the data type of an input line from its length."""
+    if len(line) < 100:
+        return "spectrum"
+    elif len(line) < 200:
+        return "statistics"
+    else:
+        return "pgram"
+
+
+def main() -> None:
     parser = argparse.ArgumentParser(
         description="Parse Borealis base64 encoded acoustic data from stdin."
     )
@@ -144,51 +226,100 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    writer = csv.writer(sys.stdout)
-    for line in sys.stdin:
-        line = line.rstrip()
-
-        data_type = args.data_type
-        if data_type is None:
-            if len(line) < 100:
-                data_type = "spectrum"
-            elif len(line) < 200:
-                data_type = "statistics"
-            else:
-                data_type = "pgram"
-
-        if data_type == "statistics":
+    # Collect each table in a 1 MiB buffer, flushed once per table, so an input line
+    # costs one write syscall (more only for tables over 1 MiB) and live feeds such as
+    # `tail -f` still see every table as soon as its line is parsed
+    with open(sys.stdout.fileno(), "wb", buffering=2**20, closefd=False) as stdout:
+
+        def write_rows(header: str, rows: Iterable[str]) -> None:
+            # All fields are plain numbers or fixed labels, so no CSV quoting is needed;
+            # rows end in \r\n like the csv module's default dialect. Rows are joined
+            # in bounded chunks so very long lines never materialize their whole table.
+            lines = itertools.chain((header,), rows)
+            while True:
+                chunk = "\r\n".join(itertools.islice(lines, 4096))
+                if not chunk:
+                    break
+                stdout.write(f"{chunk}\r\n".encode("ascii"))
+            stdout.flush()
+
+        # The pgram frequency grid only depends on df, so it is formatted once, on the
+        # first successfully parsed pgram line
+        pgram_frequencies: Optional[List[str]] = None
+        default_df_reported = False
+
+        def handle_statistics(line: bytes) -> None:
             result = parse_borealis_levels_stats(line)
             if result is not None:
-                writer.writerow(["Frequency", "Q1", "Q2", "Q3", "Mean"])
                 # Add frequency as first column and format each float to 2 decimal places
-                for i, row in enumerate(result):
-                    frequency = f"{calculate_ansi_midband_frequency(i):.2f}"
-                    formatted_row = [frequency] + [f"{value:.2f}" for value in row]
-                    writer.writerow(formatted_row)
-        elif data_type == "spectrum":
+                write_rows(
+                    "Frequency,Q1,Q2,Q3,Mean",
+                    (
+                        ",".join([frequency] + [SPL_STR[value] for value in row])
+                        for frequency, row in zip(
+                            ansi_midband_frequency_strings(len(result)), result
+                        )
+                    ),
+                )
+
+        def handle_spectrum(line: bytes) -> None:
             result = parse_borealis_spectrum(line)
             if result is not None:
-                writer.writerow(["Frequency", "SPL (dB)"])
-                for i, spl in enumerate(result):
-                    frequency = f"{calculate_ansi_midband_frequency(i):.2f}"
-                    writer.writerow([frequency, f"{spl:.2f}"])
-        elif data_type == "pgram":
+                write_rows(
+                    "Frequency,SPL (dB)",
+                    (
+                        f"{frequency},{SPL_STR[spl]}"
+                        for frequency, spl in zip(
+                            ansi_midband_frequency_strings(len(result)), result
+                        )
+                    ),
+                )
+
+        def handle_pgram(line: bytes) -> None:
+            nonlocal pgram_frequencies, default_df_reported
             result = parse_borealis_pgram(line, args.df)
             if result is not None:
-                frequencies = calculate_pgram_frequencies(args.df)
+                if pgram_frequencies is None:
+                    pgram_frequencies = [
+                        f"{f:.2f}" for f in calculate_pgram_frequencies(args.df)
+                    ]
 
-                # Print assumption message to stderr if using default df
-                if args.df == 7.629:
+                # Print assumption message to stderr once if using default df
+                if args.df == 7.629 and not default_df_reported:
                     print(
                         "# Assuming default sample rate (31250 Hz) and df (7.629 Hz)",
                         file=sys.stderr,
                     )
+                    default_df_reported = True
+
+                # Bins beyond the known frequency grid are labelled "Unknown"
+                frequencies = itertools.chain(
+                    pgram_frequencies, itertools.repeat("Unknown")
+                )
+                write_rows(
+                    "Frequency,SPL (dB)",
+                    (
+                        f"{frequency},{SPL_STR[spl]}"
+                        for frequency, spl in zip(frequencies, result)
+                    ),
+                )
+
+        handlers: Dict[str, Callable[[bytes], None]] = {
+            "spectrum": handle_spectrum,
+            "statistics": handle_statistics,
+            "pgram": handle_pgram,
+        }
+        # Read raw bytes, which b64decode accepts directly, to skip decoding each line to str.
+        # Non-ASCII lines are not base64, so they are ignored like any other invalid input.
+        lines = (line.rstrip() for line in sys.stdin.buffer if line.isascii())
+        if args.data_type is None:
+            for line in lines:
+                handlers[detect_data_type(line)](line)
+        else:
+            handle = handlers[args.data_type]
+            for line in lines:
+                handle(line)
+
 
-                writer.writerow(["Frequency", "SPL (dB)"])
-                for i, spl in enumerate(result):
-                    if i < len(frequencies):
-                        frequency = f"{frequencies[i]:.2f}"
-                    else:
-                        frequency = "Unknown"
-                    writer.writerow([frequency, f"{spl:.2f}"])
+if __name__ == "__main__":
+    main()
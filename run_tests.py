@@ -9,6 +9,7 @@ Uses only built-in Python modules.
 import subprocess
 import sys
 import os
+import parse_borealis_data
 import test_fixtures
 
 
@@ -48,6 +49,35 @@ def run_tests():
         return False
 
 
+def check_fixture(data_type, fixture):
+    """Parse a fixture in-process and return (number of data points, mismatches)."""
+    if data_type == "spectrum":
+        result = parse_borealis_data.parse_borealis_spectrum(fixture["base64"])
+    elif data_type == "statistics":
+        result = parse_borealis_data.parse_borealis_levels_stats(fixture["base64"])
+    else:
+        result = parse_borealis_data.parse_borealis_pgram(
+            fixture["base64"], fixture.get("df", 7.629)
+        )
+
+    if not result:
+        return 0, []
+
+    mismatches = []
+    for index, _, expected in fixture.get("expected_samples", []):
+        if not -len(result) <= index < len(result):
+            continue
+        actual = result[index]
+        # Statistics samples hold (Q1, Q2, Q3, Mean); compare like assertAlmostEqual(places=1)
+        if data_type == "statistics":
+            matches = all(round(a - e, 1) == 0 for a, e in zip(actual, expected))
+        else:
+            matches = round(actual - expected, 1) == 0
+        if not matches:
+            mismatches.append(f"index {index}: expected {expected}, got {actual}")
+    return len(result), mismatches
+
+
 def run_example_tests():
     """Run tests with all fixture data."""
     print("\nRunning fixture data validation...")
@@ -63,42 +93,17 @@ def run_example_tests():
         for fixture in fixture_list:
             total_tests += 1
             try:
-                # Prepare command arguments
-                cmd = [
-                    sys.executable,
-                    "parse_borealis_data.py",
-                    "--data-type",
-                    data_type,
-                ]
-
-                # Add df parameter for pgram data
-                if data_type == "pgram" and "df" in fixture:
-                    cmd.extend(["--df", str(fixture["df"])])
-
-                result = subprocess.run(
-                    cmd,
-                    input=fixture["base64"],
-                    capture_output=True,
-                    text=True,
-                    cwd=os.path.dirname(__file__),
-                )
-
-                if result.returncode == 0 and result.stdout:
-                    lines = result.stdout.strip().split("\n")
-                    # Filter out comment lines (starting with #)
-                    data_lines = [line for line in lines if not line.startswith("#")]
-
-                    if len(data_lines) > 1:  # Header + at least one data line
-                        print(
-                            f"  ✅ {fixture['name']}: {len(data_lines)-1} data points"
-                        )
-                        success_count += 1
-                    else:
-                        print(f"  ❌ {fixture['name']}: No data returned")
+                data_points, mismatches = check_fixture(data_type, fixture)
+
+                if data_points == 0:
+                    print(f"  ❌ {fixture['name']}: No data returned")
+                elif mismatches:
+                    print(f"  ❌ {fixture['name']}: Unexpected values")
+                    for mismatch in mismatches:
+                        print(f"     {mismatch}")
                 else:
-                    print(f"  ❌ {fixture['name']}: Parsing failed")
-                    if result.stderr:
-                        print(f"     Error: {result.stderr.strip()}")
+                    print(f"  ✅ {fixture['name']}: {data_points} data points")
+                    success_count += 1
 
             except Exception as e:
                 print(f"  ❌ {fixture['name']}: Test failed with exception: {e}")
@@ -107,6 +112,40 @@ def run_example_tests():
     return success_count == total_tests
 
 
+def run_cli_smoke_test():
+    """Run the command line tool once end-to-end on one fixture of each type."""
+    print("\nRunning command line smoke test...")
+    print("-" * 30)
+
+    fixtures = test_fixtures.get_all_fixtures()
+    lines = [fixture_list[0]["base64"] for fixture_list in fixtures.values()]
+
+    try:
+        # One process reads all lines, relying on automatic data type detection
+        result = subprocess.run(
+            [sys.executable, "parse_borealis_data.py"],
+            input="\n".join(lines) + "\n",
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(__file__),
+        )
+    except Exception as e:
+        print(f"  ❌ Smoke test failed with exception: {e}")
+        return False
+
+    headers = [
+        line for line in result.stdout.splitlines() if line.startswith("Frequency")
+    ]
+    if result.returncode == 0 and len(headers) == len(lines):
+        print(f"  ✅ {len(lines)} tables written")
+        return True
+
+    print(f"  ❌ Expected {len(lines)} tables, got {len(headers)}")
+    if result.stderr:
+        print(f"     Error: {result.stderr.strip()}")
+    return False
+
+
 if __name__ == "__main__":
     print("Borealis Data Parser Test Suite")
     print("================================")
@@ -117,13 +156,17 @@ if __name__ == "__main__":
     # Run example validation tests
     example_tests_passed = run_example_tests()
 
+    # Run the command line tool end-to-end
+    smoke_test_passed = run_cli_smoke_test()
+
     # Final summary
     print("\n" + "=" * 50)
     print("FINAL SUMMARY:")
     print(f"Unit Tests: {'PASSED' if unit_tests_passed else 'FAILED'}")
     print(f"Example Tests: {'PASSED' if example_tests_passed else 'FAILED'}")
+    print(f"Smoke Test: {'PASSED' if smoke_test_passed else 'FAILED'}")
 
-    if unit_tests_passed and example_tests_passed:
+    if unit_tests_passed and example_tests_passed and smoke_test_passed:
         print("\n🎉 ALL TESTS PASSED! The parser is working correctly.")
         sys.exit(0)
     else:
@@ -5,26 +5,88 @@ Test suite for parse_borealis_data.py using example data from README.
 Uses only built-in Python modules for testing.
 """
 
+import base64
+import binascii
+import csv
+import os
+import re
+import select
+import subprocess
 import unittest
 import sys
 import io
-from unittest.mock import patch
 import parse_borealis_data
 import test_fixtures
 
+PARSER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "parse_borealis_data.py"
+)
+
 
 class TestParseBorealisData(unittest.TestCase):
     """Test cases for Borealis data parsing functions."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once; tests only read them."""
         # Get fixtures from test_fixtures module
-        self.fixtures = test_fixtures.get_all_fixtures()
+        cls.fixtures = test_fixtures.get_all_fixtures()
 
         # Keep original single examples for backward compatibility
-        self.spectrum_input = self.fixtures["spectrum"][0]["base64"]
-        self.statistics_input = self.fixtures["statistics"][0]["base64"]
-        self.pgram_input = self.fixtures["pgram"][0]["base64"]
+        cls.spectrum_input = cls.fixtures["spectrum"][0]["base64"]
+        cls.statistics_input = cls.fixtures["statistics"][0]["base64"]
+        cls.pgram_input = cls.fixtures["pgram"][0]["base64"]
+
+        # Decode every fixture once for the tests that parse already decoded bytes; a
+        # fixture that fails to decode is stored as None and fails only its own tests
+        cls.raw_bytes = {}
+        for fixture_list in cls.fixtures.values():
+            for fixture in fixture_list:
+                try:
+                    raw_bytes = parse_borealis_data.b64decode(
+                        fixture["base64"], validate=False
+                    )
+                except (binascii.Error, ValueError):
+                    raw_bytes = None
+                cls.raw_bytes[fixture["name"]] = raw_bytes
+
+        # ANSI midband frequencies of band indices 0-63, enough for any fixture length
+        cls.ANSI_FREQS = tuple(10.0 ** ((i + 16) / 10.0) for i in range(64))
+
+    def _fixture_bytes(self, fixture):
+        """Return the decoded bytes of a fixture, failing if it did not decode."""
+        raw_bytes = self.raw_bytes[fixture["name"]]
+        self.assertIsNotNone(raw_bytes, f"Failed to parse {fixture['name']}")
+        return raw_bytes
+
+    def setUp(self):
+        """Set up the CSV sink shared by the command line output simulations."""
+        self.output = io.StringIO()
+        self.writer = csv.writer(self.output)
+
+    def _assert_all_almost_equal(
+        self, actual, expected, labels, places=None, deltas=None
+    ):
+        """Compare element-wise like assertAlmostEqual, reporting all mismatches at once."""
+        self.assertEqual(len(actual), len(expected))
+        if deltas is None:
+            mismatches = [
+                (label, a, e)
+                for label, a, e in zip(labels, actual, expected)
+                if round(abs(a - e), places) != 0
+            ]
+        else:
+            mismatches = [
+                (label, a, e)
+                for label, a, e, delta in zip(labels, actual, expected, deltas)
+                if abs(a - e) > delta
+            ]
+        if mismatches:
+            self.fail(
+                "; ".join(
+                    f"{label}: expected {e}, got {a}" for label, a, e in mismatches
+                )
+            )
 
     def test_spectrum_parsing(self):
         """Test spectrum data parsing."""
@@ -39,6 +101,111 @@ class TestParseBorealisData(unittest.TestCase):
             self.assertAlmostEqual(result[1], 122.45, places=1)  # ~50.12 Hz
             self.assertAlmostEqual(result[-1], 96.49, places=1)  # ~19952.62 Hz
 
+    def test_parsing_from_bytes(self):
+        """Test parsing of already decoded bytes matches parsing of base64 input."""
+        spectrum_bytes = self._fixture_bytes(self.fixtures["spectrum"][0])
+        self.assertEqual(
+            parse_borealis_data.parse_borealis_spectrum_from_bytes(spectrum_bytes),
+            parse_borealis_data.parse_borealis_spectrum(self.spectrum_input),
+        )
+        self.assertEqual(
+            parse_borealis_data.parse_borealis_levels_stats_from_bytes(
+                self._fixture_bytes(self.fixtures["statistics"][0])
+            ),
+            parse_borealis_data.parse_borealis_levels_stats(self.statistics_input),
+        )
+        self.assertEqual(
+            parse_borealis_data.parse_borealis_pgram_from_bytes(
+                self._fixture_bytes(self.fixtures["pgram"][0])
+            ),
+            parse_borealis_data.parse_borealis_pgram(self.pgram_input, 7.629),
+        )
+
+        # A trailing partial triplet still yields its complete 12-bit value
+        self.assertEqual(
+            len(
+                parse_borealis_data.parse_borealis_spectrum_from_bytes(
+                    spectrum_bytes[:5]
+                )
+            ),
+            3,
+        )
+
+    def test_spectrum_unpacking_matches_nibble_reference(self):
+        """Test 12-bit unpacking against a straightforward nibble-by-nibble reference."""
+
+        def unpack_reference(raw_bytes):
+            nibbles = [b >> shift & 0xF for b in raw_bytes for shift in (0, 4)]
+            return [
+                nibbles[i] | nibbles[i + 1] << 4 | nibbles[i + 2] << 8
+                for i in range(0, (len(raw_bytes) * 2) // 3 * 3, 3)
+            ]
+
+        raw_bytes = bytes(range(256)) + bytes(range(255, -1, -3))
+        for length in range(len(raw_bytes) - 6, len(raw_bytes) + 1):
+            with self.subTest(length=length):
+                expected = [
+                    parse_borealis_data.SPL_LUT_12[code]
+                    for code in unpack_reference(raw_bytes[:length])
+                ]
+                self.assertEqual(
+                    parse_borealis_data.parse_borealis_spectrum_from_bytes(
+                        raw_bytes[:length]
+                    ),
+                    expected,
+                )
+
+    def test_bytes_input(self):
+        """Test that parsers accept base64 input as bytes, as read from stdin."""
+        self.assertEqual(
+            parse_borealis_data.parse_borealis_spectrum(self.spectrum_input.encode()),
+            parse_borealis_data.parse_borealis_spectrum(self.spectrum_input),
+        )
+        self.assertEqual(
+            parse_borealis_data.parse_borealis_levels_stats(
+                self.statistics_input.encode()
+            ),
+            parse_borealis_data.parse_borealis_levels_stats(self.statistics_input),
+        )
+        self.assertEqual(
+            parse_borealis_data.parse_borealis_pgram(self.pgram_input.encode(), 7.629),
+            parse_borealis_data.parse_borealis_pgram(self.pgram_input, 7.629),
+        )
+
+    def test_base64_backend_matches_stdlib(self):
+        """Test that parsing with the active base64 backend (pybase64 if installed) matches the stdlib decoder."""
+        parsers = {
+            "spectrum": (
+                parse_borealis_data.parse_borealis_spectrum,
+                parse_borealis_data.parse_borealis_spectrum_from_bytes,
+            ),
+            "statistics": (
+                parse_borealis_data.parse_borealis_levels_stats,
+                parse_borealis_data.parse_borealis_levels_stats_from_bytes,
+            ),
+            "pgram": (
+                lambda line: parse_borealis_data.parse_borealis_pgram(line, 7.629),
+                parse_borealis_data.parse_borealis_pgram_from_bytes,
+            ),
+        }
+
+        def parse_with_stdlib(parse_from_bytes, line):
+            # Invalid input parses to None, like the parsers themselves
+            try:
+                raw_bytes = base64.b64decode(line)
+            except (binascii.Error, ValueError):
+                return None
+            return parse_from_bytes(raw_bytes)
+
+        mismatched = [
+            fixture["name"]
+            for data_type, (parse, parse_from_bytes) in parsers.items()
+            for fixture in self.fixtures[data_type]
+            if parse(fixture["base64"])
+            != parse_with_stdlib(parse_from_bytes, fixture["base64"])
+        ]
+        self.assertFalse(mismatched, f"Backend output differs for: {mismatched}")
+
     def test_statistics_parsing(self):
         """Test statistics data parsing."""
         result = parse_borealis_data.parse_borealis_levels_stats(self.statistics_input)
@@ -84,8 +251,14 @@ class TestParseBorealisData(unittest.TestCase):
         self.assertGreater(len(frequencies), 100)
 
         # Test that frequencies are increasing
-        for i in range(1, len(frequencies)):
-            self.assertGreater(frequencies[i], frequencies[i - 1])
+        non_increasing = [
+            i
+            for i, (previous, current) in enumerate(
+                zip(frequencies, frequencies[1:]), start=1
+            )
+            if not current > previous
+        ]
+        self.assertFalse(non_increasing, f"non-monotonic at {non_increasing}")
 
         # Test linear portion (first few frequencies)
         self.assertAlmostEqual(frequencies[0], 2 * df, places=2)  # 2*df
@@ -100,6 +273,66 @@ class TestParseBorealisData(unittest.TestCase):
         # Check transition point
         self.assertAlmostEqual(frequencies[linear_count - 1], (N - 1) * df, places=2)
 
+    def test_pgram_frequency_cache(self):
+        """Test repeated pgram frequency calculations reuse the cached grid."""
+        cached = parse_borealis_data._pgram_frequencies
+        first = parse_borealis_data.calculate_pgram_frequencies(7.629)
+        hits_before = cached.cache_info().hits
+        second = parse_borealis_data.calculate_pgram_frequencies(7.629)
+
+        self.assertEqual(cached.cache_info().hits, hits_before + 1)
+        self.assertEqual(first, second)
+
+        # Each call returns its own list, so callers cannot corrupt the cache
+        self.assertIsNot(first, second)
+        first.clear()
+        self.assertEqual(
+            parse_borealis_data.calculate_pgram_frequencies(7.629), second
+        )
+
+    def test_pgram_frequency_count_matches_loop(self):
+        """Test the closed-form log bin count against an explicit growth loop."""
+
+        def reference_count(df):
+            import math
+
+            N = math.ceil(24 / math.log(2))
+            factor = 2 ** (1 / 24)
+            f = N * df
+            log_count = 0
+            while f <= 20000 and log_count < 200:
+                log_count += 1
+                f *= factor
+            return N - 2 + log_count
+
+        # 539.3567501038249 puts the third log bin exactly on 20 kHz
+        dfs = [7.629, 1.0, 0.01, 571.0, 572.0, 20000 / 35, 539.3567501038249, 1e5]
+        dfs += [float("inf"), float("-inf"), float("nan"), 0.0, -0.0, -7.629, 1e-320]
+        self.assertEqual(
+            [len(parse_borealis_data.calculate_pgram_frequencies(df)) for df in dfs],
+            [reference_count(df) for df in dfs],
+            f"bin counts for df values {dfs}",
+        )
+
+    def test_pgram_frequency_count_near_20khz(self):
+        """Test the grid keeps exactly the log bins at or below 20 kHz at the boundary."""
+        import math
+
+        N = math.ceil(24 / math.log(2))
+        factor = 2 ** (1 / 24)
+        dfs = []
+        for k in range(1, 60):
+            df = 20000 / (N * factor**k)
+            dfs += [df, math.nextafter(df, 0), math.nextafter(df, math.inf)]
+
+        misplaced = []
+        for df in dfs:
+            log_freqs = parse_borealis_data.calculate_pgram_frequencies(df)[N - 2 :]
+            next_freq = N * df * factor ** len(log_freqs)
+            if max(log_freqs) > 20000 or next_freq <= 20000:
+                misplaced.append(df)
+        self.assertFalse(misplaced, f"20 kHz cut-off misplaced for df {misplaced}")
+
     def test_data_type_detection(self):
         """Test automatic data type detection based on input length."""
         # Test spectrum detection (short string)
@@ -112,6 +345,15 @@ class TestParseBorealisData(unittest.TestCase):
         # Test pgram detection (long string)
         self.assertGreaterEqual(len(self.pgram_input), 200)
 
+        # Test the detection used by the command line tool
+        detect = parse_borealis_data.detect_data_type
+        self.assertEqual(detect(self.spectrum_input), "spectrum")
+        self.assertEqual(detect(self.statistics_input), "statistics")
+        self.assertEqual(detect(self.pgram_input), "pgram")
+        self.assertEqual(detect("A" * 99), "spectrum")
+        self.assertEqual(detect("A" * 100), "statistics")
+        self.assertEqual(detect("A" * 200), "pgram")
+
     def test_invalid_base64_handling(self):
         """Test handling of invalid base64 input."""
         invalid_input = "invalid_base64_string!"
@@ -125,6 +367,16 @@ class TestParseBorealisData(unittest.TestCase):
         result_pgram = parse_borealis_data.parse_borealis_pgram(invalid_input, 7.629)
         self.assertIsNone(result_pgram)
 
+        # Non-ASCII input is rejected by the decoder with ValueError
+        non_ascii_input = "YcurqkquiRqphlqpé"
+        self.assertIsNone(parse_borealis_data.parse_borealis_spectrum(non_ascii_input))
+        self.assertIsNone(
+            parse_borealis_data.parse_borealis_levels_stats(non_ascii_input)
+        )
+        self.assertIsNone(
+            parse_borealis_data.parse_borealis_pgram(non_ascii_input, 7.629)
+        )
+
     def test_calc_db_step_for_bits(self):
         """Test dB step calculation for different bit depths."""
         # Test 8-bit (used for statistics and pgram)
@@ -135,136 +387,239 @@ class TestParseBorealisData(unittest.TestCase):
         step_12bit = parse_borealis_data.calc_db_step_for_bits(12)
         self.assertAlmostEqual(step_12bit, 192 / (2**12), places=3)
 
-    @patch("sys.stdout", new_callable=io.StringIO)
-    @patch("sys.stderr", new_callable=io.StringIO)
-    def test_main_spectrum_output(self, mock_stderr, mock_stdout):
-        """Test main function output for spectrum data."""
-        test_input = self.spectrum_input + "\n"
+        # Module constants hold the same steps
+        self.assertEqual(parse_borealis_data.CSTEP_8, step_8bit)
+        self.assertEqual(parse_borealis_data.CSTEP_12, step_12bit)
+
+    def test_spl_lookup_tables(self):
+        """Test SPL lookup tables cover every code with the expected scaling."""
+        for bits, table in [
+            (8, parse_borealis_data.SPL_LUT_8),
+            (12, parse_borealis_data.SPL_LUT_12),
+        ]:
+            with self.subTest(bits=bits):
+                self.assertEqual(len(table), 2**bits)
+                step = parse_borealis_data.calc_db_step_for_bits(bits)
+                for code in (0, 1, 2**bits - 1):
+                    self.assertEqual(
+                        table[code],
+                        code * step + parse_borealis_data.MIN_BOREALIS_SPL_DB,
+                    )
+                spl_str = parse_borealis_data.SPL_STR
+                misformatted = [
+                    spl for spl in table if spl_str[spl] != format(spl, ".2f")
+                ]
+                self.assertFalse(misformatted, f"misformatted SPLs: {misformatted}")
+
+    def _run_main_like(self, line, df=7.629):
+        """Simulate the command line output for one input line and return it."""
+        # Reuse the writer and its buffer, discarding output of any earlier call
+        self.output.seek(0)
+        self.output.truncate(0)
+
+        line = line.strip()
+        data_type = parse_borealis_data.detect_data_type(line)
+
+        # Normalize every data type to (header, rows of values, frequencies)
+        if data_type == "statistics":
+            header = ["Frequency", "Q1", "Q2", "Q3", "Mean"]
+            rows = parse_borealis_data.parse_borealis_levels_stats(line)
+        else:
+            header = ["Frequency", "SPL (dB)"]
+            if data_type == "spectrum":
+                result = parse_borealis_data.parse_borealis_spectrum(line)
+            else:
+                result = parse_borealis_data.parse_borealis_pgram(line, df)
+            rows = None if result is None else [[spl] for spl in result]
+
+        if rows is None:
+            return self.output.getvalue()
 
-        # Test the parsing logic directly since there's no main function
-        import csv
+        if data_type == "pgram":
+            frequencies = parse_borealis_data.calculate_pgram_frequencies(df)
+        else:
+            calc = parse_borealis_data.calculate_ansi_midband_frequency
+            frequencies = [calc(i) for i in range(len(rows))]
 
-        output = io.StringIO()
-        writer = csv.writer(output)
+        writerow = self.writer.writerow
+        writerow(header)
+        for i, row in enumerate(rows):
+            frequency = f"{frequencies[i]:.2f}" if i < len(frequencies) else "Unknown"
+            writerow([frequency] + [f"{value:.2f}" for value in row])
 
-        line = test_input.strip()
-        data_type = (
-            "spectrum"
-            if len(line) < 100
-            else ("statistics" if len(line) < 200 else "pgram")
-        )
+        return self.output.getvalue()
 
-        if data_type == "spectrum":
-            result = parse_borealis_data.parse_borealis_spectrum(line)
-            if result is not None:
-                writer.writerow(["Frequency", "SPL (dB)"])
-                for i, spl in enumerate(result):
-                    frequency = (
-                        f"{parse_borealis_data.calculate_ansi_midband_frequency(i):.2f}"
-                    )
-                    writer.writerow([frequency, f"{spl:.2f}"])
-
-        output_str = output.getvalue()
+    def test_main_spectrum_output(self):
+        """Test main function output for spectrum data."""
+        output_str = self._run_main_like(self.spectrum_input + "\n")
         self.assertIn("Frequency,SPL (dB)", output_str)
         self.assertIn("39.81,130.19", output_str)
 
-    @patch("sys.stdout", new_callable=io.StringIO)
-    @patch("sys.stderr", new_callable=io.StringIO)
-    def test_main_statistics_output(self, mock_stderr, mock_stdout):
+    def test_main_statistics_output(self):
         """Test main function output for statistics data."""
-        test_input = self.statistics_input + "\n"
-
-        # Simulate the main logic for statistics
-        import csv
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        line = test_input.strip()
-        data_type = (
-            "spectrum"
-            if len(line) < 100
-            else ("statistics" if len(line) < 200 else "pgram")
-        )
-
-        if data_type == "statistics":
-            result = parse_borealis_data.parse_borealis_levels_stats(line)
-            if result is not None:
-                writer.writerow(["Frequency", "Q1", "Q2", "Q3", "Mean"])
-                for i, row in enumerate(result):
-                    frequency = (
-                        f"{parse_borealis_data.calculate_ansi_midband_frequency(i):.2f}"
-                    )
-                    formatted_row = [frequency] + [f"{value:.2f}" for value in row]
-                    writer.writerow(formatted_row)
-
-        output_str = output.getvalue()
+        output_str = self._run_main_like(self.statistics_input + "\n")
         self.assertIn("Frequency,Q1,Q2,Q3,Mean", output_str)
         self.assertIn("39.81,113.64,118.89,123.39,123.39", output_str)
 
-    @patch("sys.stdout", new_callable=io.StringIO)
-    @patch("sys.stderr", new_callable=io.StringIO)
-    def test_main_pgram_output(self, mock_stderr, mock_stdout):
+    def test_main_pgram_output(self):
         """Test main function output for pgram data."""
-        test_input = self.pgram_input + "\n"
-
-        # Simulate the main logic for pgram
-        import csv
+        output_str = self._run_main_like(self.pgram_input + "\n")
+        self.assertIn("Frequency,SPL (dB)", output_str)
+        self.assertIn("15.26,96.39", output_str)
 
-        output = io.StringIO()
-        writer = csv.writer(output)
+    def test_main_output_buffer_reuse(self):
+        """Test consecutive simulated runs do not leak output into each other."""
+        self._run_main_like(self.statistics_input)
+        output_str = self._run_main_like(self.spectrum_input)
+        self.assertTrue(output_str.startswith("Frequency,SPL (dB)"))
+        self.assertNotIn("Q1", output_str)
+
+    def _run_cli(self, lines, *args):
+        """Run the command line tool on the given input lines and return the process."""
+        return subprocess.run(
+            [sys.executable, PARSER_SCRIPT, *args],
+            input="".join(line + "\n" for line in lines).encode("ascii"),
+            capture_output=True,
+            check=True,
+        )
 
-        line = test_input.strip()
-        data_type = (
-            "spectrum"
-            if len(line) < 100
-            else ("statistics" if len(line) < 200 else "pgram")
+    def test_cli_output(self):
+        """Test the exact CSV bytes the command line tool writes for each data type."""
+        lines = [self.spectrum_input, self.statistics_input, self.pgram_input]
+
+        # Long pgram lines whose tables (header included) end exactly at, just past,
+        # and at a multiple of the 4096-row output chunks, labelled "Unknown" past the
+        # frequency grid
+        lines += [
+            base64.b64encode(bytes(i % 256 for i in range(length))).decode("ascii")
+            for length in (4095, 4096, 8191, 8192)
+        ]
+        output = self._run_cli(lines).stdout
+
+        # One table per line, each starting with its header and first row
+        tables = output.split(b"Frequency,")[1:]
+        self.assertEqual(len(tables), len(lines))
+        self.assertTrue(tables[0].startswith(b"SPL (dB)\r\n39.81,130.19\r\n"))
+        self.assertTrue(
+            tables[1].startswith(
+                b"Q1,Q2,Q3,Mean\r\n39.81,113.64,118.89,123.39,123.39\r\n"
+            )
         )
-        df = 7.629  # Default df
+        self.assertTrue(tables[2].startswith(b"SPL (dB)\r\n15.26,96.39\r\n"))
 
-        if data_type == "pgram":
-            result = parse_borealis_data.parse_borealis_pgram(line, df)
-            if result is not None:
-                frequencies = parse_borealis_data.calculate_pgram_frequencies(df)
-                writer.writerow(["Frequency", "SPL (dB)"])
-                for i, spl in enumerate(result):
-                    if i < len(frequencies):
-                        frequency = f"{frequencies[i]:.2f}"
-                    else:
-                        frequency = "Unknown"
-                    writer.writerow([frequency, f"{spl:.2f}"])
-
-        output_str = output.getvalue()
-        self.assertIn("Frequency,SPL (dB)", output_str)
-        self.assertIn("15.26,96.39", output_str)
+        # Long tables keep every row across chunk boundaries
+        self.assertEqual(
+            [table.count(b"\r\n") for table in tables[3:]], [4096, 4097, 8192, 8193]
+        )
+        last_rows = [table.split(b"\r\n")[-2] for table in tables[3:]]
+        self.assertTrue(all(row.startswith(b"Unknown,") for row in last_rows))
+
+        # Every row ends in \r\n and every value has 2 decimal places
+        rows = output.split(b"\r\n")
+        self.assertEqual(rows.pop(), b"")
+        malformed = [
+            row
+            for row in rows
+            if not row.startswith(b"Frequency,")
+            and not re.fullmatch(rb"(-?\d+\.\d\d|Unknown)(,-?\d+\.\d\d)+", row)
+        ]
+        self.assertFalse(malformed, f"malformed rows: {malformed}")
+
+        # The whole output matches what the csv module writes for the same tables
+        expected = "".join(self._run_main_like(line) for line in lines)
+        self.assertEqual(output, expected.encode("ascii"))
+
+    def test_cli_default_df_notice(self):
+        """Test the default df notice is printed once, after a parsed pgram line."""
+        notice = b"# Assuming default sample rate (31250 Hz) and df (7.629 Hz)"
+        invalid_pgram = "A" * 201  # incorrect padding, rejected by the decoder
+
+        process = self._run_cli([invalid_pgram])
+        self.assertEqual(process.stdout, b"")
+        self.assertNotIn(notice, process.stderr)
+
+        process = self._run_cli([invalid_pgram, self.pgram_input, self.pgram_input])
+        self.assertEqual(process.stdout.count(b"Frequency,SPL (dB)"), 2)
+        self.assertEqual(process.stderr.count(notice), 1)
+
+        process = self._run_cli([self.pgram_input], "--df", "10")
+        self.assertNotIn(notice, process.stderr)
+
+    def test_cli_pgram_grid_not_needed(self):
+        """Test non-pgram output does not depend on the pgram frequency grid."""
+        process = self._run_cli(
+            [self.spectrum_input], "--data-type", "spectrum", "--df", "inf"
+        )
+        self.assertTrue(process.stdout.startswith(b"Frequency,SPL (dB)\r\n"))
+        self.assertEqual(process.stderr, b"")
+
+    def test_cli_flushes_each_table(self):
+        """Test each table is written as soon as its line is read, before stdin ends."""
+        expected = self._run_main_like(self.spectrum_input).encode("ascii")
+        process = subprocess.Popen(
+            [sys.executable, PARSER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            # Keep stdin open, like a live feed, and wait for the table to arrive
+            process.stdin.write(self.spectrum_input.encode("ascii") + b"\n")
+            process.stdin.flush()
+            received = b""
+            while len(received) < len(expected):
+                if not select.select([process.stdout], [], [], 10)[0]:
+                    break
+                chunk = os.read(process.stdout.fileno(), 2**16)
+                if not chunk:
+                    break
+                received += chunk
+            self.assertEqual(received, expected)
+        finally:
+            process.stdin.close()
+            process.stdout.close()
+            process.wait()
 
     def test_ansi_frequency_calculation(self):
         """Test that ANSI frequency calculation is correct."""
-        # Test first few frequencies
-        self.assertAlmostEqual(
-            parse_borealis_data.calculate_ansi_midband_frequency(0), 39.811, places=2
-        )  # 10^(16/10)
-        self.assertAlmostEqual(
-            parse_borealis_data.calculate_ansi_midband_frequency(1), 50.119, places=2
-        )  # 10^(17/10)
-        self.assertAlmostEqual(
-            parse_borealis_data.calculate_ansi_midband_frequency(2), 63.096, places=2
-        )  # 10^(18/10)
-
-        # Test some middle frequencies
-        self.assertAlmostEqual(
-            parse_borealis_data.calculate_ansi_midband_frequency(10), 398.107, places=1
-        )  # 10^(26/10)
-        self.assertAlmostEqual(
-            parse_borealis_data.calculate_ansi_midband_frequency(20), 3981.072, places=0
-        )  # 10^(36/10)
+        # (band index, expected frequency = 10^((index + 16)/10), decimal places)
+        cases = [
+            # first few frequencies
+            (0, 39.811, 2),
+            (1, 50.119, 2),
+            (2, 63.096, 2),
+            # some middle frequencies
+            (10, 398.107, 1),
+            (20, 3981.072, 0),
+            # last frequency (index 27 = band 43)
+            (27, 19952.623, 0),
+        ]
+        calc = parse_borealis_data.calculate_ansi_midband_frequency
+        for places in {places for _, _, places in cases}:
+            indices = [index for index, _, p in cases if p == places]
+            self._assert_all_almost_equal(
+                [calc(index) for index in indices],
+                [expected for _, expected, p in cases if p == places],
+                labels=[f"band index {index}" for index in indices],
+                places=places,
+            )
+
+        # The table used by the fixture tests holds the same frequencies
+        self.assertEqual(
+            self.ANSI_FREQS, tuple(calc(i) for i in range(len(self.ANSI_FREQS)))
+        )
 
-        # Test last frequency (index 27 = band 43)
-        self.assertAlmostEqual(
-            parse_borealis_data.calculate_ansi_midband_frequency(27),
-            19952.623,
-            places=0,
-        )  # 10^(43/10)
+    def test_ansi_frequency_strings(self):
+        """Test cached ANSI frequency strings match the calculated frequencies."""
+        calc = parse_borealis_data.calculate_ansi_midband_frequency
+        for count in (28, len(parse_borealis_data.ANSI_FREQ_STR) + 5):
+            with self.subTest(count=count):
+                frequencies = parse_borealis_data.ansi_midband_frequency_strings(count)
+                self.assertGreaterEqual(len(frequencies), count)
+                self.assertEqual(
+                    list(frequencies[:count]),
+                    [format(calc(i), ".2f") for i in range(count)],
+                )
 
     def test_min_borealis_spl_constant(self):
         """Test that MIN_BOREALIS_SPL_DB constant is correct."""
@@ -273,148 +628,119 @@ class TestParseBorealisData(unittest.TestCase):
             parse_borealis_data.MIN_BOREALIS_SPL_DB, expected_value, places=3
         )
 
-    def test_all_spectrum_fixtures(self):
-        """Test all spectrum fixtures."""
-        spectrum_fixtures = test_fixtures.get_fixtures_by_type("spectrum")
-        self.assertGreater(len(spectrum_fixtures), 0, "No spectrum fixtures found")
-
-        for fixture in spectrum_fixtures:
-            with self.subTest(fixture=fixture["name"]):
-                result = parse_borealis_data.parse_borealis_spectrum(fixture["base64"])
-                self.assertIsNotNone(result, f"Failed to parse {fixture['name']}")
-
-                if result is not None:
-                    # Test specific expected samples if provided
-                    if "expected_samples" in fixture:
-                        for index, expected_frequency, expected_spl in fixture[
-                            "expected_samples"
-                        ]:
-                            # Handle negative indices (e.g., -1 for last element)
-                            actual_index = index if index >= 0 else len(result) + index
-
-                            # Check that index is within bounds of the actual result
-                            if 0 <= actual_index < len(result):
-                                actual_spl = result[actual_index]
-                                actual_frequency = parse_borealis_data.calculate_ansi_midband_frequency(
-                                    actual_index
-                                )
-
-                                # Validate frequency matches expected ANSI frequency (within tolerance)
-                                # Use higher tolerance since we changed from hardcoded to calculated values
-                                self.assertAlmostEqual(
-                                    actual_frequency,
-                                    expected_frequency,
-                                    delta=expected_frequency * 0.05,  # 5% tolerance
-                                    msg=f"Fixture {fixture['name']}: Expected frequency {expected_frequency} at index {index}, got {actual_frequency}",
-                                )
-
-                                # Validate SPL value
-                                self.assertAlmostEqual(
-                                    actual_spl,
-                                    expected_spl,
-                                    places=1,
-                                    msg=f"Fixture {fixture['name']}: Expected {expected_spl} dB at {expected_frequency} Hz (index {index}), got {actual_spl}",
-                                )
-
-    def test_all_statistics_fixtures(self):
-        """Test all statistics fixtures."""
-        statistics_fixtures = test_fixtures.get_fixtures_by_type("statistics")
-        self.assertGreater(len(statistics_fixtures), 0, "No statistics fixtures found")
-
-        for fixture in statistics_fixtures:
-            with self.subTest(fixture=fixture["name"]):
-                result = parse_borealis_data.parse_borealis_levels_stats(
-                    fixture["base64"]
-                )
-                self.assertIsNotNone(result, f"Failed to parse {fixture['name']}")
-
-                if result is not None:
-                    # Each entry should be a list of 4 values
-                    for row in result:
-                        self.assertIsInstance(row, list)
-                        self.assertEqual(len(row), 4)
-
-                    # Test specific expected samples if provided
-                    if "expected_samples" in fixture:
-                        for index, expected_frequency, expected_values in fixture[
-                            "expected_samples"
-                        ]:
-                            # Handle negative indices properly
-                            actual_index = index if index >= 0 else len(result) + index
-
-                            # Check that index is within bounds of the actual result
-                            if 0 <= actual_index < len(result):
-                                actual_values = result[actual_index]
-                                actual_frequency = parse_borealis_data.calculate_ansi_midband_frequency(
-                                    actual_index
-                                )
-
-                                # Validate frequency matches expected frequency (within tolerance)
-                                # Use higher tolerance since we changed from hardcoded to calculated values
-                                self.assertAlmostEqual(
-                                    actual_frequency,
-                                    expected_frequency,
-                                    delta=expected_frequency * 0.05,  # 5% tolerance
-                                    msg=f"Fixture {fixture['name']}: Expected frequency {expected_frequency} at index {index}, got {actual_frequency}",
-                                )
-
-                                # Validate statistical values
-                                self.assertEqual(len(actual_values), 4)
-                                for i, (actual, expected) in enumerate(
-                                    zip(actual_values, expected_values)
-                                ):
-                                    stat_names = ["Q1", "Q2", "Q3", "Mean"]
-                                    self.assertAlmostEqual(
-                                        actual,
-                                        expected,
-                                        places=1,
-                                        msg=f"Fixture {fixture['name']}: Expected {stat_names[i]}={expected} at {expected_frequency} Hz (index {index}), got {actual}",
-                                    )
-
-    def test_all_pgram_fixtures(self):
-        """Test all pgram fixtures."""
-        pgram_fixtures = test_fixtures.get_fixtures_by_type("pgram")
-        self.assertGreater(len(pgram_fixtures), 0, "No pgram fixtures found")
-
-        for fixture in pgram_fixtures:
-            with self.subTest(fixture=fixture["name"]):
-                df = fixture.get("df", 7.629)
-                result = parse_borealis_data.parse_borealis_pgram(fixture["base64"], df)
-                self.assertIsNotNone(result, f"Failed to parse {fixture['name']}")
-
-                if result is not None:
-                    # Should have many frequency bins
-                    self.assertGreater(len(result), 50)
-
-                    # Test specific expected samples if provided
-                    if "expected_samples" in fixture:
-                        # Calculate frequencies for this fixture
-                        frequencies = parse_borealis_data.calculate_pgram_frequencies(
-                            df
-                        )
-
-                        for index, expected_freq, expected_spl in fixture[
-                            "expected_samples"
-                        ]:
-                            if index < len(result) and index < len(frequencies):
-                                actual_spl = result[index]
-                                actual_frequency = frequencies[index]
-
-                                # Validate frequency matches expected frequency
-                                self.assertAlmostEqual(
-                                    actual_frequency,
-                                    expected_freq,
-                                    places=2,
-                                    msg=f"Fixture {fixture['name']}: Expected frequency {expected_freq} Hz at index {index}, got {actual_frequency} Hz",
-                                )
-
-                                # Validate SPL value
-                                self.assertAlmostEqual(
-                                    actual_spl,
-                                    expected_spl,
-                                    places=1,
-                                    msg=f"Fixture {fixture['name']}: Expected {expected_spl} dB at {expected_freq} Hz (index {index}), got {actual_spl}",
-                                )
+    def test_fixtures_available(self):
+        """Test that every data type has fixtures to generate tests from."""
+        for data_type in ("spectrum", "statistics", "pgram"):
+            self.assertGreater(
+                len(test_fixtures.get_fixtures_by_type(data_type)),
+                0,
+                f"No {data_type} fixtures found",
+            )
+
+    def _check_spectrum_fixture(self, fixture):
+        result = parse_borealis_data.parse_borealis_spectrum_from_bytes(
+            self._fixture_bytes(fixture)
+        )
+
+        # Handle negative indices (e.g., -1 for last element) and skip
+        # samples outside the bounds of the actual result
+        samples = [
+            (index if index >= 0 else len(result) + index, frequency, spl)
+            for index, frequency, spl in fixture.get("expected_samples", [])
+        ]
+        samples = [s for s in samples if 0 <= s[0] < len(result)]
+        labels = [f"index {index} ({f} Hz)" for index, f, _ in samples]
+
+        # Validate frequency matches expected ANSI frequency (within tolerance)
+        # Use higher tolerance since we changed from hardcoded to calculated values
+        self._assert_all_almost_equal(
+            [self.ANSI_FREQS[index] for index, _, _ in samples],
+            [frequency for _, frequency, _ in samples],
+            labels=labels,
+            deltas=[frequency * 0.05 for _, frequency, _ in samples],
+        )
+
+        # Validate SPL values
+        self._assert_all_almost_equal(
+            [result[index] for index, _, _ in samples],
+            [spl for _, _, spl in samples],
+            labels=labels,
+            places=1,
+        )
+
+    def _check_statistics_fixture(self, fixture):
+        result = parse_borealis_data.parse_borealis_levels_stats_from_bytes(
+            self._fixture_bytes(fixture)
+        )
+
+        # Each entry should be a list of 4 values
+        for row in result:
+            self.assertIsInstance(row, list)
+            self.assertEqual(len(row), 4)
+
+        # Handle negative indices properly and skip samples outside
+        # the bounds of the actual result
+        samples = [
+            (index if index >= 0 else len(result) + index, freq, values)
+            for index, freq, values in fixture.get("expected_samples", [])
+        ]
+        samples = [s for s in samples if 0 <= s[0] < len(result)]
+
+        # Validate frequency matches expected frequency (within tolerance)
+        # Use higher tolerance since we changed from hardcoded to calculated values
+        self._assert_all_almost_equal(
+            [self.ANSI_FREQS[index] for index, _, _ in samples],
+            [frequency for _, frequency, _ in samples],
+            labels=[f"index {index}" for index, _, _ in samples],
+            deltas=[frequency * 0.05 for _, frequency, _ in samples],
+        )
+
+        # Validate all statistical values of all samples together
+        stat_names = ["Q1", "Q2", "Q3", "Mean"]
+        self._assert_all_almost_equal(
+            [value for index, _, _ in samples for value in result[index]],
+            [value for _, _, values in samples for value in values],
+            labels=[
+                f"{name} at index {index} ({frequency} Hz)"
+                for index, frequency, _ in samples
+                for name in stat_names
+            ],
+            places=1,
+        )
+
+    def _check_pgram_fixture(self, fixture):
+        df = fixture.get("df", 7.629)
+        result = parse_borealis_data.parse_borealis_pgram_from_bytes(
+            self._fixture_bytes(fixture)
+        )
+
+        # Should have many frequency bins
+        self.assertGreater(len(result), 50)
+
+        # Calculate frequencies for this fixture
+        frequencies = parse_borealis_data.calculate_pgram_frequencies(df)
+        samples = [
+            sample
+            for sample in fixture.get("expected_samples", [])
+            if sample[0] < len(result) and sample[0] < len(frequencies)
+        ]
+        labels = [f"index {index} ({f} Hz)" for index, f, _ in samples]
+
+        # Validate frequencies match expected frequencies
+        self._assert_all_almost_equal(
+            [frequencies[index] for index, _, _ in samples],
+            [frequency for _, frequency, _ in samples],
+            labels=labels,
+            places=2,
+        )
+
+        # Validate SPL values
+        self._assert_all_almost_equal(
+            [result[index] for index, _, _ in samples],
+            [spl for _, _, spl in samples],
+            labels=labels,
+            places=1,
+        )
 
     def test_fixture_data_type_detection(self):
         """Test that all fixtures have correct lengths for automatic detection."""
@@ -422,17 +748,38 @@ class TestParseBorealisData(unittest.TestCase):
         self.assertEqual(len(issues), 0, f"Fixture length validation failed: {issues}")
 
         # Test each fixture type is detected correctly
-        for data_type, fixtures in self.fixtures.items():
-            for fixture in fixtures:
-                length = len(fixture["base64"])
-                with self.subTest(fixture=fixture["name"], data_type=data_type):
-                    if data_type == "spectrum":
-                        self.assertLess(length, 100)
-                    elif data_type == "statistics":
-                        self.assertGreaterEqual(length, 100)
-                        self.assertLess(length, 200)
-                    elif data_type == "pgram":
-                        self.assertGreaterEqual(length, 200)
+        misdetected = [
+            (fixture["name"], data_type, len(fixture["base64"]))
+            for data_type, fixtures in self.fixtures.items()
+            for fixture in fixtures
+            if parse_borealis_data.detect_data_type(fixture["base64"]) != data_type
+        ]
+        self.assertFalse(misdetected, f"Fixtures detected as wrong type: {misdetected}")
+
+
+def _make_fixture_test(data_type, fixture):
+    def test(self):
+        getattr(self, f"_check_{data_type}_fixture")(fixture)
+
+    test.__doc__ = f"Test {data_type} fixture {fixture['name']}."
+    return test
+
+
+# One test method per fixture, so parallel runners can schedule fixtures independently.
+# Fixture names key the decoded bytes and the generated test methods, so a repeated
+# name, or one clashing with a hand-written test, would silently drop a test.
+for _data_type, _fixtures in test_fixtures.get_all_fixtures().items():
+    for _fixture in _fixtures:
+        _test_name = f"test_{_fixture['name']}"
+        if hasattr(TestParseBorealisData, _test_name):
+            raise ValueError(
+                f"fixture {_fixture['name']!r} does not give a unique test name"
+            )
+        setattr(
+            TestParseBorealisData,
+            _test_name,
+            _make_fixture_test(_data_type, _fixture),
+        )
 
 
 if __name__ == "__main__":